@@ -0,0 +1,71 @@
+"""
+Export the trained Ensemble Stacking Regressor to ONNX.
+
+Run this once at model-build time (after training) to produce
+models/ensemble.onnx. The API picks the ONNX graph up automatically at
+startup and serves it through ONNX Runtime, which fuses the whole stack
+(XGBoost + RidgeCV + meta-estimator) into a single optimized session.
+
+Requires the optional export dependencies:
+    pip install skl2onnx onnxmltools onnxruntime
+
+Command: python -m src.export_onnx
+"""
+
+import joblib
+import numpy as np
+from pathlib import Path
+
+import xgboost as xgb
+from skl2onnx import convert_sklearn, update_registered_converter
+from skl2onnx.common.data_types import FloatTensorType
+from skl2onnx.common.shape_calculator import calculate_linear_regressor_output_shapes
+from onnxmltools.convert.xgboost.operator_converters.XGBoost import convert_xgboost
+
+BASE_DIR = Path(__file__).parent.parent
+MODEL_PATH = BASE_DIR / 'models' / 'ensemble_forecaster.pkl'
+ONNX_PATH = BASE_DIR / 'models' / 'ensemble.onnx'
+N_FEATURES = 10
+
+
+def export():
+    """Convert the pickled StackingRegressor to a single ONNX graph."""
+    ensemble_model = joblib.load(MODEL_PATH)
+    print(f"✓ Loaded ensemble model from {MODEL_PATH}")
+
+    # skl2onnx does not know about XGBoost estimators out of the box;
+    # register the onnxmltools converter for them.
+    update_registered_converter(
+        xgb.XGBRegressor,
+        'XGBoostXGBRegressor',
+        calculate_linear_regressor_output_shapes,
+        convert_xgboost,
+    )
+
+    onnx_model = convert_sklearn(
+        ensemble_model,
+        initial_types=[('X', FloatTensorType([None, N_FEATURES]))],
+        target_opset=17,
+    )
+
+    ONNX_PATH.write_bytes(onnx_model.SerializeToString())
+    print(f"✓ ONNX model saved to {ONNX_PATH}")
+
+    # Sanity check: ONNX Runtime output must match the sklearn predictor.
+    import onnxruntime as ort
+
+    session = ort.InferenceSession(str(ONNX_PATH))
+    sample = np.array(
+        [[180, 6, 29, 15.0, 14.8, 15.1, 1014.0, 60.0, 10.0, 0.5]],
+        dtype=np.float32,
+    )
+    onnx_pred = session.run(None, {'X': sample})[0][0]
+    skl_pred = ensemble_model.predict(sample)[0]
+    print(f"  sklearn: {skl_pred:.4f}  onnx: {float(onnx_pred):.4f}")
+    if abs(float(onnx_pred) - float(skl_pred)) > 0.01:
+        raise RuntimeError("ONNX prediction diverges from sklearn predictor")
+    print("✓ ONNX output matches sklearn predictor")
+
+
+if __name__ == "__main__":
+    export()
@@ -0,0 +1,54 @@
+"""
+Ray Serve deployment for the Global Weather Forecast API.
+
+A single uvicorn process caps prediction throughput at roughly one CPU
+core. This entrypoint replicates the FastAPI app across Ray Serve
+replicas — one process per core, each holding its own loaded predictor —
+so the compute-bound single-sample predict scales linearly without GIL
+contention. Ray Serve handles the HTTP routing and load balancing.
+
+Requires the optional dependency:
+    pip install "ray[serve]"
+
+Command: serve run src.serve_ray:deployment
+Or:      python -m src.serve_ray
+"""
+
+import os
+import time
+
+try:
+    from ray import serve
+except ImportError as e:
+    raise ImportError(
+        "Ray Serve is not installed. Install it with: pip install 'ray[serve]'"
+    ) from e
+
+from src.app import app
+
+# One replica per CPU by default; each replica pins its predictor to a
+# single thread (see src/app.py), so num_cpus=1 per actor is exact.
+NUM_REPLICAS = int(os.getenv("SERVE_NUM_REPLICAS", str(os.cpu_count() or 1)))
+
+
+@serve.deployment(num_replicas=NUM_REPLICAS, ray_actor_options={"num_cpus": 1})
+@serve.ingress(app)
+class WeatherForecastDeployment:
+    """FastAPI app wrapped as a Ray Serve deployment.
+
+    The app's startup hooks run per replica, so every replica loads its
+    own nthread=1 predictor (ONNX / Treelite / sklearn fallback).
+    """
+
+
+deployment = WeatherForecastDeployment.bind()
+
+
+if __name__ == "__main__":
+    serve.run(deployment)
+    print(f"✓ Ray Serve running with {NUM_REPLICAS} replicas")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        serve.shutdown()